@@ -0,0 +1,79 @@
+import threading
+from collections import deque
+
+# Messages of a task run by _map_in_order, held until the calling thread prints them
+_task_messages = threading.local()
+
+
+def _print_message(message: str) -> None:
+    """
+    Print a message, or hold it for the calling thread when run as a _map_in_order task.
+
+    Args:
+        message (str): The message to print.
+
+    Returns:
+        None
+    """
+    messages = getattr(_task_messages, "messages", None)
+    if messages is None:
+        print(message)
+    else:
+        messages.append(message)
+
+
+def _run_task(func: callable, item) -> tuple:
+    """
+    Run a _map_in_order task, collecting the messages it prints through _print_message.
+
+    Args:
+        func (callable): The function to apply.
+        item: The argument to apply it to.
+
+    Returns:
+        tuple: The function's result and the list of messages it printed.
+    """
+    _task_messages.messages = messages = []
+    try:
+        return func(item), messages
+    finally:
+        _task_messages.messages = None
+
+
+def _map_in_order(executor, func: callable, items, max_pending: int = None):
+    """
+    Apply a function to items on an executor, yielding the results in input order.
+
+    Unlike executor.map, messages the tasks print through _print_message are printed on
+    the calling thread, in input order, so lines from concurrent tasks never interleave.
+    Tasks still pending when the generator is closed are cancelled.
+
+    Args:
+        executor (concurrent.futures.Executor): The executor to run the tasks on.
+        func (callable): The function to apply to each item.
+        items (iterable): The items to apply the function to.
+        max_pending (int, optional): The most tasks submitted ahead of the result being
+            consumed, which bounds how many results are held at once. Defaults to None,
+            which submits every task upfront.
+
+    Yields:
+        The result of func for each item.
+    """
+
+    def finish(future):
+        result, messages = future.result()
+        for message in messages:
+            print(message)
+        return result
+
+    pending = deque()
+    try:
+        for item in items:
+            if max_pending is not None and len(pending) >= max_pending:
+                yield finish(pending.popleft())
+            pending.append(executor.submit(_run_task, func, item))
+        while pending:
+            yield finish(pending.popleft())
+    finally:
+        for future in pending:
+            future.cancel()
@@ -1,5 +1,4 @@
 import os
-import json
 from datetime import datetime
 
 from .json_utils import _load_json, _write_json
@@ -1,30 +1,130 @@
+import codecs
 import json
+import math
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from typing import Union
 
+from .concurrency_utils import _print_message
 
-def _load_json(file_path: str) -> dict:
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard library is used without it
+    orjson = None
+
+# Files above this size are memory-mapped rather than read, see _open_json_bytes
+_MMAP_THRESHOLD = 16 * 1024
+
+# orjson reads integers too large for 64 bits as floats, losing digits, where json keeps
+# them exact. Any such integer has at least 19 digits.
+_LONG_INTEGER_RE = re.compile(rb"\d{19}")
+
+
+@contextmanager
+def _open_json_bytes(file_path: str):
     """
-    Loads and returns the content of a JSON file.
+    Opens a JSON file and yields its raw content.
+
+    When orjson is available, files larger than _MMAP_THRESHOLD are memory-mapped so
+    they can be searched and parsed in place instead of being copied into a bytes
+    object first. The mapping is only valid inside the with block.
 
     Args:
         file_path (str): Path to the JSON file.
 
-    Returns:
-        dict: Parsed JSON data.
+    Yields:
+        bytes | mmap.mmap | None: Raw file content, or None if the file cannot be read.
+    """
+    try:
+        file = open(file_path, "rb")
+    except IOError as e:
+        _print_message(f"Error: Unable to read or write file: {file_path}. {str(e)}")
+        yield None
+        return
+
+    with file:
+        buffer = None
+        try:
+            if orjson is not None and os.fstat(file.fileno()).st_size > _MMAP_THRESHOLD:
+                raw = buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                raw = file.read()
+        except (IOError, ValueError) as e:
+            _print_message(
+                f"Error: Unable to read or write file: {file_path}. {str(e)}"
+            )
+            raw = None
+        try:
+            yield raw
+        finally:
+            if buffer is not None:
+                buffer.close()
 
-    Raises:
-        json.JSONDecodeError: If the JSON cannot be parsed.
-        IOError: If the file cannot be read.
+
+def _parse_json(raw: Union[bytes, mmap.mmap], file_path: str) -> dict:
+    """
+    Parses raw JSON content read from a file.
+
+    Args:
+        raw (bytes | mmap.mmap): Raw JSON content.
+        file_path (str): Path the content was read from, used in error messages.
+
+    Returns:
+        dict: Parsed JSON data, or an empty dict if the JSON cannot be parsed.
     """
+    if orjson is not None and not _LONG_INTEGER_RE.search(raw):
+        # orjson rejects a leading BOM, which json.loads tolerates on bytes input
+        start = len(codecs.BOM_UTF8) if raw[:3] == codecs.BOM_UTF8 else 0
+        try:
+            with memoryview(raw) as view:
+                return orjson.loads(view[start:])
+        except json.JSONDecodeError:  # also raised by orjson
+            pass  # NaN, infinities and lone surrogates, which json accepts
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            return json.load(file)
+        return json.loads(raw[:])
     except json.JSONDecodeError:
-        print(f"Error: Unable to parse JSON in file: {file_path}")
-    except IOError as e:
-        print(f"Error: Unable to read or write file: {file_path}. {str(e)}")
+        _print_message(f"Error: Unable to parse JSON in file: {file_path}")
     return {}
 
 
+def _has_non_finite_float(data) -> bool:
+    """
+    Checks whether JSON data holds NaN or an infinity, which orjson writes as null.
+
+    Args:
+        data: Parsed JSON data.
+
+    Returns:
+        bool: True if any float in the data is NaN or infinite, False otherwise.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, float) and not math.isfinite(node):
+            return True
+    return False
+
+
+def _load_json(file_path: str) -> dict:
+    """
+    Loads and returns the content of a JSON file.
+
+    Args:
+        file_path (str): Path to the JSON file.
+
+    Returns:
+        dict: Parsed JSON data, or an empty dict if the file cannot be read or parsed.
+    """
+    with _open_json_bytes(file_path) as raw:
+        return {} if raw is None else _parse_json(raw, file_path)
+
+
 def _write_json(file_path: str, data: dict) -> None:
     """
     Write JSON data to a file with indentation.
@@ -36,5 +136,52 @@ def _write_json(file_path: str, data: dict) -> None:
     Returns:
         None
     """
+    if orjson is not None:
+        try:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:  # integers too large for 64 bits or lone surrogates
+            content = None
+        # orjson would write NaN and infinities as null, so those are left to json
+        if content is not None and not (
+            b"null" in content and _has_non_finite_float(data)
+        ):
+            # Text mode keeps the platform's line endings, as json.dump does
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(content.decode("utf-8"))
+            return
+
     with open(file_path, "w", encoding="utf-8") as file:
         json.dump(data, file, indent=2)
+
+
+def _iter_json_files(directory: str, file_pattern: str = ".json"):
+    """
+    Recursively yield the paths of files under a directory matching a file pattern.
+
+    Uses os.scandir so the entry type comes from the directory listing itself
+    instead of an extra stat call per entry, and an explicit stack of directories
+    instead of recursion. Files are yielded in the same top-down order as os.walk,
+    and as with os.walk, unreadable directories and symlinked directories are skipped.
+
+    Args:
+        directory (str): The directory to search in.
+        file_pattern (str): The suffix the file names must end with. Defaults to ".json".
+
+    Yields:
+        str: The full path of each matching file.
+    """
+    directories = [directory]
+    while directories:
+        subdirectories = []
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirectories.append(entry.path)
+                    elif entry.name.endswith(file_pattern):
+                        yield entry.path
+        except OSError:
+            continue
+        # Pushed in reverse so the first subdirectory is walked next
+        directories.extend(reversed(subdirectories))
@@ -1,7 +1,11 @@
 import os
 import csv
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Optional, Union
 
+from .concurrency_utils import _map_in_order
 from .json_utils import _load_json
 
 HEADER_FIELDS = [
@@ -105,12 +109,62 @@ def _get_page_order(report_path: str) -> list:
         list: List of page IDs in the correct order.
     """
     pages_json_path = os.path.join(report_path, "definition", "pages", "pages.json")
+    try:
+        stat = os.stat(pages_json_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    # Return a copy so callers cannot modify the cached page order
+    return list(_load_page_order(pages_json_path, signature))
+
+
+@lru_cache(maxsize=8)
+def _load_page_order(pages_json_path: str, signature: Optional[tuple]) -> tuple:
+    """
+    Load the page order from a pages.json file, cached until the file is modified.
+
+    Args:
+        pages_json_path (str): Path to the pages.json file.
+        signature (tuple | None): The file's (mtime_ns, size), so a modified file is reloaded.
+
+    Returns:
+        tuple: Page IDs in the correct order.
+    """
     pages_data = _load_json(pages_json_path)
-    return pages_data["pageOrder"]
+    return tuple(pages_data["pageOrder"])
+
+
+# Keys that set the usage detail of the fields beneath them, checked for every key traversed
+_USAGE_DETAIL_KEYS = frozenset(
+    [
+        "backColor",
+        "Category",
+        "categoryAxis",
+        "Data",
+        "dataPoint",
+        "error",
+        "fontColor",
+        "icon",
+        "labels",
+        "legend",
+        "Series",
+        "singleVisual",
+        "Size",
+        "sort",
+        "Tooltips",
+        "valueAxis",
+        "Values",
+        "webURL",
+        "X",
+        "Y",
+        "Y2",
+    ]
+)
+_FILTER_KEYS = frozenset(["filters", "filter", "parameters"])
 
 
 def _traverse_pbir_json_structure(
-    data: dict | list, usage_context: str = None, usage_detail: str = None
+    data: Union[dict, list], usage_context: str = None, usage_detail: str = None
 ) -> object:
     """
     Recursively traverses the Power BI Enhanced Report Format (PBIR) JSON structure to extract specific metadata.
@@ -138,31 +192,9 @@ def _traverse_pbir_json_structure(
                 yield (value, None, usage_context, None, usage_detail)
             elif key == "Property":
                 yield (None, value, usage_context, None, usage_detail)
-            elif key in [
-                "backColor",
-                "Category",
-                "categoryAxis",
-                "Data",
-                "dataPoint",
-                "error",
-                "fontColor",
-                "icon",
-                "labels",
-                "legend",
-                "Series",
-                "singleVisual",
-                "Size",
-                "sort",
-                "Tooltips",
-                "valueAxis",
-                "Values",
-                "webURL",
-                "X",
-                "Y",
-                "Y2",
-            ]:
+            elif key in _USAGE_DETAIL_KEYS:
                 yield from _traverse_pbir_json_structure(value, usage_context, key)
-            elif key in ["filters", "filter", "parameters"]:
+            elif key in _FILTER_KEYS:
                 yield from _traverse_pbir_json_structure(value, usage_context, "filter")
             elif key == "visual":
                 yield from _traverse_pbir_json_structure(
@@ -312,48 +344,47 @@ def _consolidate_metadata_from_directory(
         else "*.Report*"
     )
 
-    for root, _, files in os.walk(directory_path):
-        if fnmatch.fnmatch(root, report_pattern):
-            for file in files:
-                if file.endswith(".json"):
-                    json_file_path = os.path.join(root, file)
+    json_file_paths = [
+        os.path.join(root, file)
+        for root, _, files in os.walk(directory_path)
+        if fnmatch.fnmatch(root, report_pattern)
+        for file in files
+        if file.endswith(".json")
+    ]
 
-                    # Extract metadata from the JSON file
-                    file_metadata = _extract_metadata_from_file(json_file_path, filters)
+    # Extract metadata from the JSON files concurrently, keeping the walk order
+    with ThreadPoolExecutor() as executor:
+        for file_metadata in _map_in_order(
+            executor,
+            partial(_extract_metadata_from_file, filters=filters),
+            json_file_paths,
+        ):
+            # Separate the extracted rows with and without expressions
+            for row in file_metadata:
+                if row["Expression"] is None:
+                    all_rows_without_expression.append(row)
+                else:
+                    all_rows_with_expression.append(row)
 
-                    # Separate the extracted rows
-                    rows_with_expression = [
-                        row for row in file_metadata if row["Expression"] is not None
-                    ]
-                    rows_without_expression = [
-                        row for row in file_metadata if row["Expression"] is None
-                    ]
+    def _field_key(row: dict) -> tuple:
+        return (row["Report"], row["Table"], row["Column or Measure"])
 
-                    # Aggregate all rows with and without expressions
-                    all_rows_with_expression.extend(rows_with_expression)
-                    all_rows_without_expression.extend(rows_without_expression)
+    # Index expressions by field, keeping the first one found for each field
+    expressions = {}
+    for row_with in all_rows_with_expression:
+        expressions.setdefault(_field_key(row_with), row_with["Expression"])
 
     # Add expressions from rows_with_expression to rows_without_expression if applicable
+    used_fields = set()
     for row_without in all_rows_without_expression:
-        for row_with in all_rows_with_expression:
-            if (
-                row_without["Report"] == row_with["Report"]
-                and row_without["Table"] == row_with["Table"]
-                and row_without["Column or Measure"] == row_with["Column or Measure"]
-            ):
-                row_without["Expression"] = row_with["Expression"]
-                break  # Stop looking once a match is found
+        field_key = _field_key(row_without)
+        used_fields.add(field_key)
+        if field_key in expressions:
+            row_without["Expression"] = expressions[field_key]
 
     # Ensure rows_with_expression that were not used anywhere are added to rows_without_expression
     final_rows = all_rows_without_expression + [
-        row
-        for row in all_rows_with_expression
-        if not any(
-            row["Report"] == r["Report"]
-            and row["Table"] == r["Table"]
-            and row["Column or Measure"] == r["Column or Measure"]
-            for r in all_rows_without_expression
-        )
+        row for row in all_rows_with_expression if _field_key(row) not in used_fields
     ]
 
     # Extract distinct rows
@@ -394,25 +425,25 @@ def export_pbir_metadata_to_csv(
     }
 
     # Get page orders for each report
+    # Map each page ID to its position so the sort key is a dict lookup, not a list scan
     report_page_orders = {
-        report_name: _get_page_order(report_path)
+        report_name: {
+            page_id: index for index, page_id in enumerate(_get_page_order(report_path))
+        }
         for report_name, report_path in report_paths.items()
     }
 
-    # Sort by Report name alphabetically, then by Page ID based on the page order
+    # Sort by Report name alphabetically, then by Page ID based on the page order.
+    # Rows of pages missing from the page order sort last.
     metadata.sort(
         key=lambda row: (
             row["Report"],
-            (
-                report_page_orders.get(row["Report"], []).index(row["Page ID"])
-                if row["Page ID"] in report_page_orders.get(row["Report"], [])
-                else len(report_page_orders.get(row["Report"], [])) + 1
-            ),
+            report_page_orders[row["Report"]].get(row["Page ID"], float("inf")),
         )
     )
 
     # Write to CSV
     with open(csv_output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=HEADER_FIELDS)
-        writer.writeheader()
-        writer.writerows(metadata)
+        writer = csv.writer(csvfile)
+        writer.writerow(HEADER_FIELDS)
+        writer.writerows([row[field] for field in HEADER_FIELDS] for row in metadata)
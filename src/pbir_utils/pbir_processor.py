@@ -1,45 +1,107 @@
 import csv
-import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
 
-from .json_utils import _load_json, _write_json
+from .concurrency_utils import _map_in_order
+from .json_utils import (
+    _iter_json_files,
+    _open_json_bytes,
+    _parse_json,
+    _write_json,
+)
 
+# Matches both quoted and unquoted table names, avoiding those inside square brackets
+_TABLE_RE = re.compile(r"(?<!\[)('+)?(\b[\w\s]+?\b)\1|\b([\w]+)\b(?!\])")
+# Matches table[column], 'table'[column], or 'table name'[column]
+_COLUMN_RE = re.compile(r"('[A-Za-z0-9_ ]+'?|[A-Za-z0-9_]+)\[([A-Za-z0-9_]+)\]")
 
-def _load_csv_mapping(csv_path: str) -> list[dict]:
+
+def _load_csv_mapping(csv_path: str) -> list[tuple]:
     """
-    Load a CSV file and return a list of dictionaries mapping from old (entity, column) pairs
+    Load a CSV file and return a list of tuples mapping from old (entity, column) pairs
     to new (entity, column) pairs, filtering out invalid rows based on specified conditions.
 
     Parameters:
     - csv_path: Path to the CSV file.
 
     Returns:
-    - A list of dictionaries with keys as 'old_tbl', 'old_col', 'new_tbl', 'new_col'.
+    - A list of (old_tbl, old_col, new_tbl, new_col) tuples.
     """
     mappings = []
     with open(csv_path, "r", newline="", encoding="utf-8-sig") as csvfile:
-        reader = csv.DictReader(csvfile)
+        reader = csv.reader(csvfile)
         expected_columns = ["old_tbl", "old_col", "new_tbl", "new_col"]
-        # Strip BOM from the column names if present
-        fieldnames = [name.lstrip("\ufeff") for name in reader.fieldnames]
+        # The utf-8-sig codec already drops a leading BOM from the header
+        fieldnames = next(reader, [])
         if not all(col in fieldnames for col in expected_columns):
             raise ValueError(
                 f"CSV file must contain the following columns: {', '.join(expected_columns)}"
             )
+        indexes = [fieldnames.index(col) for col in expected_columns]
+        width = len(fieldnames)
         for row in reader:
-            old_tbl, old_col, new_tbl, new_col = (
-                row["old_tbl"],
-                row["old_col"],
-                row["new_tbl"],
-                row["new_col"],
-            )
+            if len(row) < width:  # treat missing trailing fields as empty
+                row += [""] * (width - len(row))
+            old_tbl, old_col, new_tbl, new_col = (row[index] for index in indexes)
             if old_tbl and (new_tbl or (old_col and new_col)):
-                mappings.append(row)
+                mappings.append((old_tbl, old_col, new_tbl, new_col))
     return mappings
 
 
+def _compile_table_pattern(table_map: dict) -> re.Pattern:
+    """
+    Compile a table reference pattern whose unquoted branch only matches mapped table names.
+
+    Quoted names are still matched generically so they are consumed as a whole, exactly
+    as with _TABLE_RE, but unmapped bare identifiers no longer reach the replacement callback.
+
+    Parameters:
+    - table_map: A dictionary mapping old table names to new table names.
+
+    Returns:
+    - A compiled pattern with the same groups as _TABLE_RE.
+    """
+    names = sorted(
+        (name for name in table_map if re.fullmatch(r"\w+", name)),
+        key=len,
+        reverse=True,
+    )
+    alternation = "|".join(re.escape(name) for name in names) or "(?!)"
+    return re.compile(rf"(?<!\[)('+)(\b[\w\s]+?\b)\1|\b({alternation})\b(?!\])")
+
+
+def _compile_column_pattern(column_map: dict) -> re.Pattern:
+    """
+    Compile a table[column] reference pattern that only matches mapped column names.
+
+    Parameters:
+    - column_map: A dictionary mapping table names to dictionaries of old column names to new column names.
+
+    Returns:
+    - A compiled pattern with the same groups as _COLUMN_RE.
+    """
+    names = sorted(
+        {
+            column
+            for columns in column_map.values()
+            for column in columns
+            if re.fullmatch(r"[A-Za-z0-9_]+", column)
+        },
+        key=len,
+        reverse=True,
+    )
+    alternation = "|".join(re.escape(name) for name in names) or "(?!)"
+    return re.compile(rf"('[A-Za-z0-9_ ]+'?|[A-Za-z0-9_]+)\[({alternation})\]")
+
+
 def _update_dax_expression(
-    expression: str, table_map: dict = None, column_map: dict = None
+    expression: str,
+    table_map: dict = None,
+    column_map: dict = None,
+    table_pattern: re.Pattern = None,
+    column_pattern: re.Pattern = None,
 ) -> str:
     """
     Update DAX expressions based on table_map and/or column_map.
@@ -47,12 +109,18 @@ def _update_dax_expression(
     Parameters:
     - expression: The DAX expression to update.
     - table_map: A dictionary mapping old table names to new table names.
-    - column_map: A dictionary mapping old (table, column) pairs to new (table, column) pairs.
+    - column_map: A dictionary mapping table names to dictionaries of old column names to new column names.
+    - table_pattern: Optional pattern from _compile_table_pattern for table_map. Defaults to _TABLE_RE.
+    - column_pattern: Optional pattern from _compile_column_pattern for column_map. Defaults to _COLUMN_RE.
 
     Returns:
     - Updated DAX expression.
     """
-    if table_map:
+    # Without a mapping-specific pattern, skip the regex scan when no mapped table
+    # name can appear in the expression
+    if table_map and (
+        table_pattern or any(table_name in expression for table_name in table_map)
+    ):
 
         def replace_table_name(match):
             full_match = match.group(0)
@@ -68,11 +136,9 @@ def _update_dax_expression(
                 return f"{quotes}{new_table}{quotes}"
             return full_match
 
-        # Updated pattern to match both quoted and unquoted table names, avoiding those inside square brackets
-        pattern = re.compile(r"(?<!\[)('+)?(\b[\w\s]+?\b)\1|\b([\w]+)\b(?!\])")
-        expression = pattern.sub(replace_table_name, expression)
+        expression = (table_pattern or _TABLE_RE).sub(replace_table_name, expression)
 
-    if column_map:
+    if column_map and "[" in expression:
 
         def replace_column_name(match):
             full_match = match.group(0)
@@ -82,8 +148,9 @@ def _update_dax_expression(
             # Remove quotes from table name for lookup
             table_name = table_part.strip("'")
 
-            if (table_name, column_name) in column_map:
-                new_column = column_map[(table_name, column_name)]
+            columns = column_map.get(table_name)
+            if columns and column_name in columns:
+                new_column = columns[column_name]
                 # Preserve original quoting style if no spaces in new table name
                 if " " in table_name or table_part.startswith("'"):
                     table_part = f"'{table_name}'"
@@ -92,95 +159,84 @@ def _update_dax_expression(
                 return f"{table_part}[{new_column}]"
             return full_match
 
-        # Pattern to match table[column], 'table'[column], or 'table name'[column]
-        pattern = re.compile(r"('[A-Za-z0-9_ ]+'?|[A-Za-z0-9_]+)\[([A-Za-z0-9_]+)\]")
-        expression = pattern.sub(replace_column_name, expression)
+        expression = (column_pattern or _COLUMN_RE).sub(replace_column_name, expression)
 
     return expression
 
 
-def _update_entity(data: dict, table_map: dict) -> bool:
+def _update_entity_and_property(
+    data: dict,
+    table_map: dict,
+    column_map: dict,
+    table_pattern: re.Pattern = None,
+    column_pattern: re.Pattern = None,
+) -> tuple[bool, bool]:
     """
-    Update the "Entity" fields and DAX expressions in the JSON data based on the table_map.
+    Update the "Entity" and "Property" fields and DAX expressions in the JSON data in a single pass.
+
+    Entity names and table references are updated based on the table_map, and column references
+    based on the column_map, which is keyed by the updated table names.
 
     Parameters:
     - data: The JSON data to update.
     - table_map: A dictionary mapping old table names to new table names.
+    - column_map: A dictionary mapping table names to dictionaries of old column names to new column names.
+    - table_pattern: Optional pattern from _compile_table_pattern for table_map.
+    - column_pattern: Optional pattern from _compile_column_pattern for column_map.
 
     Returns:
-    - True if any updates were made, False otherwise.
+    - A tuple of (entity_updated, property_updated) flags.
     """
-    updated = False
+    entity_updated = False
+    property_updated = False
+    # Column, Measure and filter objects are only searched for entities, not properties
+    stack = [(data, bool(column_map))]
 
-    def traverse_and_update(data):
-        nonlocal updated
-        if isinstance(data, dict):
-            for key, value in data.items():
+    while stack:
+        node, property_scope = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
                 if key == "Entity" and value in table_map:
-                    data[key] = table_map[value]
-                    updated = True
+                    node[key] = table_map[value]
+                    entity_updated = True
                 elif key == "entities":
                     for entity in value:
                         if "name" in entity and entity["name"] in table_map:
                             entity["name"] = table_map[entity["name"]]
-                            updated = True
-                        traverse_and_update(entity)
+                            entity_updated = True
+                        stack.append((entity, property_scope))
                 elif key == "expression" and isinstance(value, str):
-                    original_expression = value
-                    data[key] = _update_dax_expression(
-                        original_expression, table_map=table_map
+                    new_value = _update_dax_expression(
+                        value, table_map=table_map, table_pattern=table_pattern
                     )
-                    if data[key] != original_expression:
-                        updated = True
-                else:
-                    traverse_and_update(value)
-        elif isinstance(data, list):
-            for item in data:
-                traverse_and_update(item)
-
-    traverse_and_update(data)
-    return updated
-
-
-def _update_property(data: dict, column_map: dict) -> bool:
-    """
-    Update the "Property" fields in the JSON data based on the column_map and updated table names.
-
-    Parameters:
-    - data: The JSON data to update.
-    - column_map: A dictionary mapping old (table, column) pairs to new (table, column) pairs.
-
-    Returns:
-    - True if any updates were made, False otherwise.
-    """
-    updated = False
-
-    def traverse_and_update(data):
-        nonlocal updated
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key in ["Column", "Measure"]:
+                    if new_value != value:
+                        entity_updated = True
+                    if property_scope:
+                        updated_value = _update_dax_expression(
+                            new_value,
+                            column_map=column_map,
+                            column_pattern=column_pattern,
+                        )
+                        if updated_value != new_value:
+                            property_updated = True
+                        new_value = updated_value
+                    node[key] = new_value
+                elif property_scope and key in ["Column", "Measure"]:
+                    # Nested entities may not be updated yet, so map them before the lookup
                     entity = (
                         value.get("Expression", {}).get("SourceRef", {}).get("Entity")
                     )
                     property = value.get("Property")
-                    if entity and property:
-                        if (entity, property) in column_map:
-                            new_property = column_map[(entity, property)]
-                            value["Expression"]["SourceRef"]["Entity"] = entity
-                            value["Property"] = new_property
-                            updated = True
-                elif key == "expression" and isinstance(value, str):
-                    original_expression = value
-                    value = _update_dax_expression(
-                        original_expression, column_map=column_map
-                    )
-                    if value != original_expression:
-                        data[key] = value
-                        updated = True
-                elif key == "filter":
+                    columns = column_map.get(table_map.get(entity, entity))
+                    if columns and property in columns:
+                        value["Property"] = columns[property]
+                        property_updated = True
+                    stack.append((value, False))
+                elif property_scope and key == "filter":
                     if "From" in value and "Where" in value:
-                        from_entity = value["From"][0]["Entity"]
+                        # All conditions share the entity, so resolve its columns once
+                        entity = value["From"][0]["Entity"]
+                        columns = column_map.get(table_map.get(entity, entity), {})
                         for condition in value["Where"]:
                             column = (
                                 condition.get("Condition", {})
@@ -191,22 +247,50 @@ def _update_property(data: dict, column_map: dict) -> bool:
                                 .get("Column", {})
                             )
                             property = column.get("Property")
-                            if property:
-                                if (from_entity, property) in column_map:
-                                    new_property = column_map[(from_entity, property)]
-                                    column["Property"] = new_property
-                                    updated = True
+                            if property in columns:
+                                column["Property"] = columns[property]
+                                property_updated = True
+                    stack.append((value, False))
                 else:
-                    traverse_and_update(value)
-        elif isinstance(data, list):
-            for item in data:
-                traverse_and_update(item)
+                    stack.append((value, property_scope))
+        elif isinstance(node, list):
+            stack.extend((item, property_scope) for item in node)
 
-    traverse_and_update(data)
-    return updated
+    return entity_updated, property_updated
 
 
-def _update_pbir_component(file_path: str, table_map: dict, column_map: dict):
+def _compile_mapping_prefilter(names: set) -> Optional[re.Pattern]:
+    """
+    Compile a bytes pattern that matches any file which could reference one of the given names.
+
+    Each name is reduced to its longest run of ASCII letters, digits, underscores and spaces,
+    which appears verbatim in the file however the JSON writer escapes the other characters.
+
+    Parameters:
+    - names: The table and column names targeted by the mappings.
+
+    Returns:
+    - A compiled bytes pattern, or None if some name cannot be pre-filtered.
+    """
+    fragments = set()
+    for name in names:
+        runs = re.findall(r"[A-Za-z0-9_ ]+", name)
+        if not runs:
+            return None
+        fragments.add(max(runs, key=len).encode("ascii"))
+    if not fragments:
+        return None
+    return re.compile(b"|".join(re.escape(fragment) for fragment in fragments))
+
+
+def _update_pbir_component(
+    file_path: str,
+    table_map: dict,
+    column_map: dict,
+    prefilter: re.Pattern = None,
+    table_pattern: re.Pattern = None,
+    column_pattern: re.Pattern = None,
+):
     """
     Update a single component within a Power BI Enhanced Report Format (PBIR) structure.
 
@@ -216,25 +300,27 @@ def _update_pbir_component(file_path: str, table_map: dict, column_map: dict):
     Parameters:
     - file_path: Path to the PBIR component JSON file.
     - table_map: A dictionary mapping old table names to new table names.
-    - column_map: A dictionary mapping old (table, column) pairs to new column names.
-    """
-    data = _load_json(file_path)
-
-    entity_updated = False
-    property_updated = False
-
-    if table_map:
-        entity_updated = _update_entity(data, table_map)
-        if entity_updated:
-            print(f"Entity updated in file: {file_path}")
-
-    if column_map:
-        property_updated = _update_property(data, column_map)
-        if property_updated:
-            print(f"Property updated in file: {file_path}")
+    - column_map: A dictionary mapping table names to dictionaries of old column names to new column names.
+    - prefilter: Optional bytes pattern; files whose raw content does not match it are skipped
+      without being parsed.
+    - table_pattern: Optional pattern from _compile_table_pattern for table_map.
+    - column_pattern: Optional pattern from _compile_column_pattern for column_map.
 
+    Returns:
+    - A tuple of the file path and whether entities and properties were updated.
+    """
+    # The mapping must be released before the file is rewritten below
+    with _open_json_bytes(file_path) as raw:
+        if raw is None or (prefilter and not prefilter.search(raw)):
+            return file_path, False, False
+        data = _parse_json(raw, file_path)
+
+    entity_updated, property_updated = _update_entity_and_property(
+        data, table_map, column_map, table_pattern, column_pattern
+    )
     if entity_updated or property_updated:
         _write_json(file_path, data)
+    return file_path, entity_updated, property_updated
 
 
 def batch_update_pbir_project(directory_path: str, csv_path: str):
@@ -255,23 +341,36 @@ def batch_update_pbir_project(directory_path: str, csv_path: str):
         table_map = {}
         column_map = {}
 
-        for row in mappings:
-            old_tbl, old_col, new_tbl, new_col = (
-                row["old_tbl"],
-                row["old_col"],
-                row["new_tbl"],
-                row["new_col"],
-            )
+        for old_tbl, old_col, new_tbl, new_col in mappings:
             if new_tbl and new_tbl != old_tbl:
                 table_map[old_tbl] = new_tbl
             if old_col and new_col:
                 effective_tbl = table_map.get(old_tbl, old_tbl)
-                column_map[(effective_tbl, old_col)] = new_col
-
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                if file.endswith(".json"):
-                    file_path = os.path.join(root, file)
-                    _update_pbir_component(file_path, table_map, column_map)
+                column_map.setdefault(effective_tbl, {})[old_col] = new_col
+
+        # Files that mention none of the mapped names cannot change, so skip parsing them
+        prefilter = _compile_mapping_prefilter(
+            set(table_map)
+            | {column for columns in column_map.values() for column in columns}
+        )
+
+        # Components are independent files, so they can be updated concurrently.
+        # Progress is printed here rather than by the workers so lines don't interleave.
+        update_component = partial(
+            _update_pbir_component,
+            table_map=table_map,
+            column_map=column_map,
+            prefilter=prefilter,
+            table_pattern=_compile_table_pattern(table_map),
+            column_pattern=_compile_column_pattern(column_map),
+        )
+        with ThreadPoolExecutor() as executor:
+            for file_path, entity_updated, property_updated in _map_in_order(
+                executor, update_component, _iter_json_files(directory_path)
+            ):
+                if entity_updated:
+                    print(f"Entity updated in file: {file_path}")
+                if property_updated:
+                    print(f"Property updated in file: {file_path}")
     except Exception as e:
         print(f"An error occurred: {str(e)}")
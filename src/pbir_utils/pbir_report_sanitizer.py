@@ -1,28 +1,96 @@
 from .pbir_measure_utils import remove_measures
-from .json_utils import _load_json, _write_json
+from .concurrency_utils import _map_in_order
+from .json_utils import (
+    _iter_json_files,
+    _load_json,
+    _open_json_bytes,
+    _parse_json,
+    _write_json,
+)
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
 
+# The most JSON files loaded ahead of the one being checked or processed
+_MAX_PENDING_LOADS = 64
 
-def _walk_json_files(directory: str, file_pattern: str):
+# Folders with fewer JSON files than this are loaded serially, since starting a thread
+# pool costs more than it saves on a handful of files
+_MIN_CONCURRENT_LOADS = 32
+
+# Sentinel for dict.pop, since any JSON value (including None) may be stored
+_MISSING = object()
+
+
+def _load_filtered_json(file_path: str, prefilter: bytes = None) -> Optional[dict]:
     """
-    Walk through JSON files in a directory matching a specific pattern.
+    Load a JSON file, skipping it without parsing if it cannot contain what is searched for.
+
+    Args:
+        file_path (str): Path to the JSON file.
+        prefilter (bytes, optional): If given, a file whose raw content does not contain
+            these bytes is not parsed. Defaults to None.
+
+    Returns:
+        dict | None: Parsed JSON data, or None if the file was skipped by the prefilter.
+    """
+    with _open_json_bytes(file_path) as raw:
+        if raw is not None and prefilter and raw.find(prefilter) == -1:
+            return None
+        return {} if raw is None else _parse_json(raw, file_path)
+
+
+def _iter_json_results(
+    directory: str, file_pattern: str, func: callable, prefilter: bytes = None
+):
+    """
+    Apply a function to the data of JSON files in a directory, yielding its truthy results.
+
+    Files are loaded concurrently when there are at least _MIN_CONCURRENT_LOADS of them,
+    but func is always applied on the calling thread in walk order.
+    At most _MAX_PENDING_LOADS files are loaded ahead of it, so only a bounded number of
+    parsed files are held at once. Loads still pending when the caller stops iterating
+    are cancelled.
 
     Args:
         directory (str): The directory to search in.
         file_pattern (str): The file pattern to match.
+        func (callable): The function to apply to each file's data.
+        prefilter (bytes, optional): Bytes that any file func can act on must contain.
+            Other files are skipped without being parsed. Defaults to None.
 
     Yields:
-        str: The full path of each matching file.
+        tuple: The (file_path, data, result) of each file for which func returned a truthy result.
     """
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(file_pattern):
-                yield os.path.join(root, file)
+    file_paths = list(_iter_json_files(directory, file_pattern))
+    load = partial(_load_filtered_json, prefilter=prefilter)
+    executor = None
+    if len(file_paths) < _MIN_CONCURRENT_LOADS:
+        loaded = map(load, file_paths)
+    else:
+        executor = ThreadPoolExecutor()
+        loaded = _map_in_order(executor, load, file_paths, _MAX_PENDING_LOADS)
+    try:
+        for file_path, data in zip(file_paths, loaded):
+            if data is None:
+                continue
+            result = func(data, file_path)
+            if result:
+                yield file_path, data, result
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
 
 def _process_or_check_json_files(
-    directory: str, file_pattern: str, func: callable, process: bool = False
+    directory: str,
+    file_pattern: str,
+    func: callable,
+    process: bool = False,
+    prefilter: bytes = None,
+    return_data: bool = False,
 ) -> list:
     """
     Process or check JSON files in a directory.
@@ -32,21 +100,26 @@ def _process_or_check_json_files(
         file_pattern (str): The file pattern to match.
         func (callable): The function to apply to each file's data.
         process (bool): Whether to process the files or just check.
+        prefilter (bytes, optional): Bytes that any file func can act on must contain.
+            Other files are skipped without being parsed. Defaults to None.
+        return_data (bool): Whether to include each file's parsed data in the check results,
+            as (file_path, data, result) tuples. Defaults to False.
 
     Returns:
         list: A list of results or the count of modified files.
     """
-    results = []
+    matches = _iter_json_results(directory, file_pattern, func, prefilter)
+    if not process:
+        return [
+            (file_path, data, result) if return_data else (file_path, result)
+            for file_path, data, result in matches
+        ]
+
     modified_count = 0
-    for file_path in _walk_json_files(directory, file_pattern):
-        data = _load_json(file_path)
-        result = func(data, file_path)
-        if process and result:
-            _write_json(file_path, data)
-            modified_count += 1
-        elif not process and result:
-            results.append((file_path, result))
-    return modified_count if process else results
+    for file_path, data, _ in matches:
+        _write_json(file_path, data)
+        modified_count += 1
+    return modified_count
 
 
 def remove_unused_measures(report_path: str) -> None:
@@ -79,6 +152,41 @@ def remove_unused_bookmarks(report_path: str) -> None:
     bookmarks_json_path = os.path.join(bookmarks_dir, "bookmarks.json")
     bookmarks_data = _load_json(bookmarks_json_path)
 
+    def _collect_bookmark_refs(visual_data: dict, _: str) -> set:
+        visual = visual_data.get("visual", {})
+        if (
+            visual.get("visualType") == "bookmarkNavigator"
+        ):  # bookmarks used in bookmark navigator
+            return {
+                bookmark.get("properties", {})
+                .get("bookmarkGroup", {})
+                .get("expr", {})
+                .get("Literal", {})
+                .get("Value")
+                for bookmark in visual.get("objects", {}).get("bookmarks", [])
+            }
+        visual_link = visual.get("visualContainerObjects", {}).get(
+            "visualLink", []
+        )  # bookmarks used in visual link
+        return {
+            link.get("properties", {})
+            .get("bookmark", {})
+            .get("expr", {})
+            .get("Literal", {})
+            .get("Value")
+            for link in visual_link
+        }
+
+    # Collect the quoted bookmark literals referenced by any visual in a single pass
+    referenced_bookmarks = set()
+    for _, _, refs in _iter_json_results(
+        os.path.join(report_path, "definition", "pages"),
+        "visual.json",
+        _collect_bookmark_refs,
+        prefilter=b'"bookmark',  # the bookmarks, bookmarkGroup and bookmark keys
+    ):
+        referenced_bookmarks.update(refs)
+
     def _is_bookmark_used(bookmark_name: str) -> bool:
         """
         Check if a bookmark is used in the report.
@@ -89,43 +197,7 @@ def remove_unused_bookmarks(report_path: str) -> None:
         Returns:
             bool: True if the bookmark is used, False otherwise.
         """
-
-        def _check_visual(visual_data: dict, _: str) -> str:
-            visual = visual_data.get("visual", {})
-            if (
-                visual.get("visualType") == "bookmarkNavigator"
-            ):  # check if bookmark is used in bookmark navigator
-                bookmarks_obj = visual.get("objects", {}).get("bookmarks", [])
-                return any(
-                    bookmark.get("properties", {})
-                    .get("bookmarkGroup", {})
-                    .get("expr", {})
-                    .get("Literal", {})
-                    .get("Value")
-                    == f"'{bookmark_name}'"
-                    for bookmark in bookmarks_obj
-                )
-            visual_link = visual.get("visualContainerObjects", {}).get(
-                "visualLink", []
-            )  # check if bookmark is used in visual link
-            return any(
-                link.get("properties", {})
-                .get("bookmark", {})
-                .get("expr", {})
-                .get("Literal", {})
-                .get("Value")
-                == f"'{bookmark_name}'"
-                for link in visual_link
-            )
-
-        return any(
-            result[1]
-            for result in _process_or_check_json_files(
-                os.path.join(report_path, "definition", "pages"),
-                "visual.json",
-                _check_visual,
-            )
-        )
+        return f"'{bookmark_name}'" in referenced_bookmarks
 
     used_bookmarks = set()
     new_items = []
@@ -193,14 +265,15 @@ def remove_unused_custom_visuals(report_path: str) -> None:
         visual_type = visual_data.get("visual", {}).get("visualType")
         return visual_type if visual_type in custom_visuals else None
 
-    used_visuals = set(
-        result[1]
-        for result in _process_or_check_json_files(
-            os.path.join(report_path, "definition", "pages"),
-            "visual.json",
-            _check_visual,
-        )
-    )
+    used_visuals = set()
+    for _, _, visual_type in _iter_json_results(
+        os.path.join(report_path, "definition", "pages"),
+        "visual.json",
+        _check_visual,
+    ):
+        used_visuals.add(visual_type)
+        if used_visuals == custom_visuals:  # no remaining visuals can be unused
+            break
 
     unused_visuals = custom_visuals - used_visuals
     if unused_visuals:
@@ -228,20 +301,25 @@ def disable_show_items_with_no_data(report_path: str) -> None:
     print("Action: Disabling 'Show items with no data'")
 
     def _remove_show_all(data: dict, _: str) -> bool:
-        if isinstance(data, dict):
-            if "showAll" in data:
-                del data["showAll"]
-                return True
-            return any(_remove_show_all(value, _) for value in data.values())
-        elif isinstance(data, list):
-            return any(_remove_show_all(item, _) for item in data)
-        return False
+        # Visit every node so that all occurrences are removed, not just the first one
+        modified = False
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if node.pop("showAll", _MISSING) is not _MISSING:
+                    modified = True
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return modified
 
     visuals_modified = _process_or_check_json_files(
         os.path.join(report_path, "definition", "pages"),
         "visual.json",
         _remove_show_all,
         process=True,
+        prefilter=b'"showAll"',
     )
 
     if visuals_modified > 0:
@@ -274,11 +352,13 @@ def hide_tooltip_drillthrough_pages(report_path: str) -> None:
         return None
 
     results = _process_or_check_json_files(
-        os.path.join(report_path, "definition", "pages"), "page.json", _check_page
+        os.path.join(report_path, "definition", "pages"),
+        "page.json",
+        _check_page,
+        return_data=True,
     )
 
-    for file_path, page_name in results:
-        page_data = _load_json(file_path)
+    for file_path, page_data, page_name in results:
         page_data["visibility"] = "HiddenInViewMode"
         _write_json(file_path, page_data)
         print(f"Hidden page: {page_name}")
@@ -315,6 +395,37 @@ def set_first_page_as_active(report_path: str) -> None:
         print("No changes needed. The first page is already set as active.")
 
 
+def _remove_folders(folder_paths) -> None:
+    """
+    Remove folders and their contents concurrently, since the deletes are I/O-bound.
+
+    Args:
+        folder_paths (iterable): Paths of the folders to remove.
+
+    Returns:
+        None
+    """
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(shutil.rmtree, folder_paths))
+
+
+def _has_any_visual(visuals_dir: str) -> bool:
+    """
+    Check if a page's visuals folder exists and is not empty.
+
+    Args:
+        visuals_dir (str): The path to the visuals folder.
+
+    Returns:
+        bool: True if the folder has at least one entry, False otherwise.
+    """
+    try:
+        with os.scandir(visuals_dir) as entries:
+            return next(entries, None) is not None  # stop at the first entry
+    except OSError:  # missing folder
+        return False
+
+
 def remove_empty_pages(report_path: str) -> None:
     """
     Remove empty pages and clean up rogue folders in the report.
@@ -336,12 +447,7 @@ def remove_empty_pages(report_path: str) -> None:
     non_empty_pages = [
         page
         for page in page_order
-        if os.path.exists(
-            os.path.join(pages_dir, page, "visuals")
-        )  # check if page has visuals folder
-        and os.listdir(
-            os.path.join(pages_dir, page, "visuals")
-        )  # check if visuals folder is not empty
+        if _has_any_visual(os.path.join(pages_dir, page, "visuals"))
     ]
 
     if non_empty_pages:
@@ -361,11 +467,14 @@ def remove_empty_pages(report_path: str) -> None:
 
     if folders_to_remove:
         print(f"Removing empty and rogue page folders: {', '.join(folders_to_remove)}")
-        for folder in folders_to_remove:
-            folder_path = os.path.join(pages_dir, folder)
-            if os.path.isdir(folder_path):
-                shutil.rmtree(folder_path)
-                print(f"Removed folder: {folder}")
+        removable_folders = [
+            folder
+            for folder in folders_to_remove
+            if os.path.isdir(os.path.join(pages_dir, folder))
+        ]
+        _remove_folders(os.path.join(pages_dir, folder) for folder in removable_folders)
+        for folder in removable_folders:
+            print(f"Removed folder: {folder}")
     else:
         print("No empty or rogue page folders found.")
 
@@ -444,18 +553,18 @@ def remove_hidden_visuals_never_shown(report_path: str) -> None:
 
         return shown_visuals, shown_groups
 
-    # Get shown visuals from bookmarks
+    # Get shown visuals from bookmarks, keeping the parsed bookmarks for the update below
     shown_visuals = set()
     shown_groups = set()
-    for _, result in _process_or_check_json_files(
+    bookmark_results = _process_or_check_json_files(
         os.path.join(report_path, "definition", "bookmarks"),
         ".bookmark.json",
         _check_bookmark,
-    ):
-        if result:
-            vis, grp = result
-            shown_visuals.update(vis)
-            shown_groups.update(grp)
+        return_data=True,
+    )
+    for _, _, (vis, grp) in bookmark_results:
+        shown_visuals.update(vis)
+        shown_groups.update(grp)
 
     # Determine visuals to remove
     visuals_to_remove = set()
@@ -473,6 +582,7 @@ def remove_hidden_visuals_never_shown(report_path: str) -> None:
             visuals_to_remove.add(visual)
 
     # Remove the visuals
+    removed_visuals = []
     for visual_name in visuals_to_remove:
         # Get folder from hidden_groups or hidden_visuals_results
         folder = hidden_groups.get(visual_name)
@@ -507,10 +617,13 @@ def remove_hidden_visuals_never_shown(report_path: str) -> None:
                     print(
                         f"Removed visual interactions for {visual_name} from {page_json_path}"
                     )
-            # Remove the visual folder
-            shutil.rmtree(folder)
+            # Queue the visual folder for removal
             visual_type = "group" if visual_name in hidden_groups else "visual"
-            print(f"Removed {visual_type}: {visual_name}")
+            removed_visuals.append((folder, visual_type, visual_name))
+
+    _remove_folders(dict.fromkeys(folder for folder, _, _ in removed_visuals))
+    for _, visual_type, visual_name in removed_visuals:
+        print(f"Removed {visual_type}: {visual_name}")
 
     # Update bookmarks
     def _update_bookmark(bookmark_data: dict, _: str) -> bool:
@@ -527,12 +640,11 @@ def remove_hidden_visuals_never_shown(report_path: str) -> None:
         return updated
 
     # Update bookmarks to remove references to removed visuals
-    bookmarks_updated = _process_or_check_json_files(
-        os.path.join(report_path, "definition", "bookmarks"),
-        ".bookmark.json",
-        _update_bookmark,
-        process=True,
-    )
+    bookmarks_updated = 0
+    for file_path, bookmark_data, _ in bookmark_results:
+        if _update_bookmark(bookmark_data, file_path):
+            _write_json(file_path, bookmark_data)
+            bookmarks_updated += 1
 
     print(
         f"Removed {len(visuals_to_remove)} visuals (including groups and their children)"
@@ -562,6 +674,23 @@ def cleanup_invalid_bookmarks(report_path: str) -> None:
     pages_data = _load_json(pages_json_path)
     valid_pages = set(pages_data.get("pageOrder", []))
 
+    # Visual names of each page, loaded the first time a bookmark refers to the page
+    valid_visuals_by_page = {}
+
+    def _get_valid_visuals(page_name: str) -> set:
+        if page_name not in valid_visuals_by_page:
+            valid_visuals_by_page[page_name] = {
+                visual_name
+                for _, _, visual_name in _iter_json_results(
+                    os.path.join(
+                        report_path, "definition", "pages", page_name, "visuals"
+                    ),
+                    "visual.json",
+                    lambda data, _: data.get("name"),
+                )
+            }
+        return valid_visuals_by_page[page_name]
+
     # Track bookmarks to remove globally
     bookmarks_to_remove = set()
     stats = {"processed": 0, "removed": 0, "cleaned": 0, "updated": 0}
@@ -588,17 +717,7 @@ def cleanup_invalid_bookmarks(report_path: str) -> None:
                 continue
 
             # Get valid visuals for this page
-            valid_visuals = {
-                result[1]
-                for result in _process_or_check_json_files(
-                    os.path.join(
-                        report_path, "definition", "pages", section_name, "visuals"
-                    ),
-                    "visual.json",
-                    lambda data, _: data.get("name"),
-                )
-                if result[1]
-            }
+            valid_visuals = _get_valid_visuals(section_name)
 
             # Clean up containers and groups
             for section_key in ["visualContainers", "visualContainerGroups"]:
@@ -1,11 +1,16 @@
 import os
-import dash
-from dash import dcc, html, Input, Output
-import plotly.graph_objects as go
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Optional
 
+from .concurrency_utils import _map_in_order, _print_message
 from .json_utils import _load_json
 from .metadata_extractor import _get_page_order
 
+# Dash and Plotly are slow to import, so they are only loaded once a wireframe is drawn
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 
 def _extract_page_info(page_folder: str) -> tuple:
     """
@@ -46,9 +51,14 @@ def _extract_visual_info(visuals_folder: str) -> dict:
         dict: A dictionary with visual IDs as keys and tuples of visual information as values.
               Each tuple contains (x, y, width, height, visualType, parentGroupName, isHidden).
     """
+    with os.scandir(visuals_folder) as entries:
+        visual_folders = [
+            (entry.name, entry.path) for entry in entries if entry.is_dir()
+        ]
+
     visuals = {}
-    for visual_id in os.listdir(visuals_folder):
-        visual_json_path = os.path.join(visuals_folder, visual_id, "visual.json")
+    for visual_id, visual_folder in visual_folders:
+        visual_json_path = os.path.join(visual_folder, "visual.json")
         if not os.path.exists(visual_json_path):
             continue
 
@@ -68,51 +78,96 @@ def _extract_visual_info(visuals_folder: str) -> dict:
     return visuals
 
 
+def _load_page(page_folder: str, pages: frozenset = None) -> Optional[tuple]:
+    """
+    Load the page and visual information of a page folder.
+
+    Args:
+        page_folder (str): Path to the page folder.
+        pages (frozenset, optional): Page IDs to include. The visuals of other pages are not
+            loaded, since the page is filtered out anyway. Defaults to None.
+
+    Returns:
+        tuple | None: A tuple containing the page ID, display name, width, height and visuals
+                      information (empty for pages not in pages), or None if the page.json
+                      file does not exist.
+    """
+    try:
+        page_info = _extract_page_info(page_folder)
+        if pages and page_info[0] not in pages:
+            return (*page_info, {})
+        visuals_info = _adjust_visual_positions(
+            _extract_visual_info(os.path.join(page_folder, "visuals"))
+        )
+    except FileNotFoundError as e:
+        _print_message(str(e))
+        return None
+    return (*page_info, visuals_info)
+
+
 def _adjust_visual_positions(visuals: dict) -> dict:
     """
     Adjust visual positions based on parent-child relationships.
 
+    Positions in PBIR are relative to the parent group, so each visual is offset by the
+    absolute position of its parent, resolving parents before their children so that
+    nested groups are placed correctly.
+
     Args:
         visuals (dict): Dictionary with visual information.
 
     Returns:
-        dict: Dictionary with adjusted visual positions.
+        dict: Dictionary with absolute visual positions.
     """
-    return {
-        vid: (
-            x + visuals[parent][0] if parent in visuals else x,
-            y + visuals[parent][1] if parent in visuals else y,
-            width,
-            height,
-            name,
-            parent,
-            is_hidden,
-        )
-        for vid, (x, y, width, height, name, parent, is_hidden) in visuals.items()
-    }
+    adjusted = {}
+    for vid in visuals:
+        # Collect the chain of ancestors that have not been placed yet
+        chain = []
+        current = vid
+        while current in visuals and current not in adjusted and current not in chain:
+            chain.append(current)
+            current = visuals[current][5]
+
+        offset_x, offset_y = adjusted[current][:2] if current in adjusted else (0, 0)
+        for chain_vid in reversed(chain):  # outermost group first
+            x, y, width, height, name, parent, is_hidden = visuals[chain_vid]
+            offset_x += x
+            offset_y += y
+            adjusted[chain_vid] = (
+                offset_x,
+                offset_y,
+                width,
+                height,
+                name,
+                parent,
+                is_hidden,
+            )
+
+    return {vid: adjusted[vid] for vid in visuals}
 
 
 def _create_wireframe_figure(
-    page_width: int, page_height: int, visuals_info: dict, show_hidden: bool = True
-) -> go.Figure:
+    page_width: int, page_height: int, sorted_visuals: list, show_hidden: bool = True
+) -> "go.Figure":
     """
     Create a Plotly figure for the wireframe of a page.
 
     Args:
         page_width (int): Width of the page.
         page_height (int): Height of the page.
-        visuals_info (dict): Dictionary with visual information.
+        sorted_visuals (list): (visual ID, visual information) pairs with absolute positions,
+            in the order the traces are drawn.
         show_hidden (bool): Flag to determine if hidden visuals should be shown. Defaults to True.
 
     Returns:
         go.Figure: Plotly figure object for the wireframe.
     """
-    fig = go.Figure()
-
-    adjusted_visuals = _adjust_visual_positions(visuals_info)
-    sorted_visuals = sorted(adjusted_visuals.items(), key=lambda x: (x[1][4], x[0]))
+    import plotly.graph_objects as go
 
-    legend_labels = []
+    # Traces are collected first so the figure is built and validated in one go,
+    # one trace per visual to keep its own legend entry and hover text
+    traces = []
+    max_label_length = 0
     for visual_id, (x, y, width, height, name, _, is_hidden) in sorted_visuals:
         if not show_hidden and is_hidden:
             continue
@@ -123,8 +178,8 @@ def _create_wireframe_figure(
 
         if name != "Group":
             label = f"{name} ({visual_id})"
-            legend_labels.append(label)
-            fig.add_trace(
+            max_label_length = max(max_label_length, len(label))
+            traces.append(
                 go.Scatter(
                     x=[x, x + width, x + width, x, x, None, center_x, None],
                     y=[y, y, y + height, y + height, y, None, center_y, None],
@@ -139,7 +194,8 @@ def _create_wireframe_figure(
                 )
             )
 
-    legend_width_pixel = max(len(label) for label in legend_labels) * 7
+    fig = go.Figure(data=traces)
+    legend_width_pixel = max_label_length * 7  # no legend when no visual is drawn
     fig.update_layout(
         width=page_width + legend_width_pixel,
         height=page_height,
@@ -169,34 +225,43 @@ def _apply_filters(
     Returns:
         list: Filtered list of tuples containing page information.
     """
+    # Sets make each membership test O(1); None means no filter
+    pages = frozenset(pages) if pages else None
+    visual_types = frozenset(visual_types) if visual_types else None
+    visual_ids = frozenset(visual_ids) if visual_ids else None
+
     filtered_pages_info = []
-    for page_id, page_name, page_width, page_height, visuals_info in pages_info:
-        if pages and page_id not in pages:
+    for page_info in pages_info:
+        page_id, page_name, page_width, page_height, visuals_info = page_info
+        if pages is not None and page_id not in pages:
             continue
 
-        filtered_visuals_info = {
-            vid: vinfo
-            for vid, vinfo in visuals_info.items()
-            if (not visual_types or vinfo[4] in visual_types)
-            and (not visual_ids or vid in visual_ids)
-        }
-
-        parents_to_add = {
-            parent_id: visuals_info[parent_id]
-            for _, vinfo in filtered_visuals_info.items()
-            if (parent_id := vinfo[5]) and parent_id not in filtered_visuals_info
-        }
-
-        filtered_visuals_info.update(parents_to_add)
+        if visual_types is None and visual_ids is None:
+            filtered_pages_info.append(page_info)  # every visual is kept
+            continue
 
-        if filtered_visuals_info or (not visual_types and not visual_ids):
+        # Parents of matching visuals are noted while filtering and added afterwards
+        filtered_visuals_info = {}
+        parent_ids = set()
+        for vid, vinfo in visuals_info.items():
+            if (visual_types is None or vinfo[4] in visual_types) and (
+                visual_ids is None or vid in visual_ids
+            ):
+                filtered_visuals_info[vid] = vinfo
+                if parent_id := vinfo[5]:
+                    parent_ids.add(parent_id)
+
+        for parent_id in parent_ids - filtered_visuals_info.keys():
+            filtered_visuals_info[parent_id] = visuals_info[parent_id]
+
+        if filtered_visuals_info:
             filtered_pages_info.append(
                 (
                     page_id,
                     page_name,
                     page_width,
                     page_height,
-                    filtered_visuals_info or visuals_info,
+                    filtered_visuals_info,
                 )
             )
 
@@ -220,21 +285,24 @@ def display_report_wireframes(
         visual_ids (list, optional): List of visual IDs to include. Defaults to None.
         show_hidden (bool, optional): Flag to determine if hidden visuals should be shown. Defaults to True.
     """
+    import dash
+    from dash import dcc, html, Input, Output
+
     pages_folder = os.path.join(report_path, "definition", "pages")
-    pages_info = []
-
-    for page_folder in filter(
-        lambda x: os.path.isdir(os.path.join(pages_folder, x)), os.listdir(pages_folder)
-    ):
-        page_folder_path = os.path.join(pages_folder, page_folder)
-        try:
-            page_info = _extract_page_info(page_folder_path)
-            visuals_info = _extract_visual_info(
-                os.path.join(page_folder_path, "visuals")
+    with os.scandir(pages_folder) as entries:
+        page_folder_paths = [entry.path for entry in entries if entry.is_dir()]
+
+    # Pages are independent folders, so they can be loaded concurrently
+    with ThreadPoolExecutor() as executor:
+        pages_info = [
+            page_info
+            for page_info in _map_in_order(
+                executor,
+                partial(_load_page, pages=frozenset(pages or ())),
+                page_folder_paths,
             )
-            pages_info.append((*page_info, visuals_info))
-        except FileNotFoundError as e:
-            print(e)
+            if page_info is not None
+        ]
 
     if not pages_info:
         print("No pages found.")
@@ -245,9 +313,12 @@ def display_report_wireframes(
         print("No pages match the given filters.")
         return
 
-    page_order = _get_page_order(report_path)
+    # Pages missing from the page order are shown last instead of failing the sort
+    page_order = {
+        page_id: index for index, page_id in enumerate(_get_page_order(report_path))
+    }
     sorted_pages_info = sorted(
-        filtered_pages_info, key=lambda x: page_order.index(x[0])
+        filtered_pages_info, key=lambda x: page_order.get(x[0], float("inf"))
     )
 
     app = dash.Dash(__name__)
@@ -265,15 +336,28 @@ def display_report_wireframes(
         ]
     )
 
+    # Sort each page's visuals by type and ID once, rather than on every tab switch
+    pages_by_id = {
+        page_id: (
+            page_width,
+            page_height,
+            sorted(visuals_info.items(), key=lambda x: (x[1][4], x[0])),
+        )
+        for page_id, _, page_width, page_height, visuals_info in sorted_pages_info
+    }
+
+    # A page's figure never changes while the app runs, so build it once per tab
+    @lru_cache(maxsize=None)
+    def page_figure(page_id: str) -> "go.Figure":
+        page_width, page_height, sorted_visuals = pages_by_id[page_id]
+        return _create_wireframe_figure(
+            page_width, page_height, sorted_visuals, show_hidden
+        )
+
     @app.callback(Output("tab-content", "children"), Input("tabs", "value"))
     def render_content(selected_tab: str):
-        for _, _, page_width, page_height, visuals_info in filter(
-            lambda item: item[0] == selected_tab, sorted_pages_info
-        ):
-            fig = _create_wireframe_figure(
-                page_width, page_height, visuals_info, show_hidden
-            )
-            return dcc.Graph(figure=fig)
-        return html.Div("Page not found")
+        if selected_tab not in pages_by_id:
+            return html.Div("Page not found")
+        return dcc.Graph(figure=page_figure(selected_tab))
 
     app.run_server(debug=True)
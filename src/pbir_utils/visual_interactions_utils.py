@@ -1,4 +1,3 @@
-import json
 import os
 
 from .json_utils import _load_json, _write_json